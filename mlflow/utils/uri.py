@@ -1,8 +1,12 @@
+import os
 import pathlib
 import posixpath
+import string
+import sys
 import urllib.parse
 import uuid
-from typing import Tuple, Any
+from functools import lru_cache
+from typing import Any, FrozenSet, Iterable, List, Optional, Tuple, Union
 
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
@@ -18,9 +22,95 @@ _INVALID_DB_URI_MSG = (
 _DBFS_FUSE_PREFIX = "/dbfs/"
 _DBFS_HDFS_URI_PREFIX = "dbfs:/"
 _DATABRICKS_UNITY_CATALOG_SCHEME = "databricks-uc"
-
-
-def is_local_uri(uri, is_tracking_or_registry_uri=True):
+_DATABRICKS_SCHEMES = ("databricks", _DATABRICKS_UNITY_CATALOG_SCHEME)
+_DATABRICKS_PROFILE_ARTIFACT_SCHEMES = ("dbfs", "runs", "models")
+_HTTP_SCHEMES = ("http", "https")
+_LOCAL_SCHEMES = ("", "file")
+_LOCAL_HOSTS = ("localhost", "127.0.0.1")
+_IS_WINDOWS = is_windows()
+_DB_ENGINE_PREFIXES = tuple(db.lower() for db in DATABASE_ENGINES)
+_BAD_DB_SCOPE_CHARS_ORDERED = "/: "
+_BAD_DB_SCOPE_CHARS = frozenset(_BAD_DB_SCOPE_CHARS_ORDERED)
+
+
+@lru_cache(maxsize=256)
+def _urlsplit_cached(uri: str) -> urllib.parse.SplitResult:
+    # The same URIs are parsed many times over by the predicates in this module. `SplitResult`
+    # is an immutable namedtuple, so it is safe to share a single instance across callers.
+    # `urlsplit` is used instead of `urlparse` because nothing here needs the `;params`
+    # component, which `urlparse` spends an extra pass extracting.
+    # URIs are deliberately not interned with `sys.intern`: unlike schemes they are unbounded,
+    # and interned strings may never be freed.
+    return urllib.parse.urlsplit(uri)
+
+
+def _clear_uri_cache() -> None:
+    _urlsplit_cached.cache_clear()
+    get_uri_scheme.cache_clear()
+    extract_db_type_from_uri.cache_clear()
+    validate_db_scope_prefix_info.cache_clear()
+    extract_and_normalize_path.cache_clear()
+
+
+_C0_CONTROL_OR_SPACE = "".join(map(chr, range(0x21)))
+# `urlsplit` removes these characters from anywhere in the URI before parsing it
+_UNSAFE_URL_CHARS_TABLE = str.maketrans("", "", "\t\r\n")
+_SCHEME_CHARS = frozenset(string.ascii_letters + string.digits + "+-.")
+# `urlsplit` only requires schemes to start with a letter on Python >= 3.11
+_SCHEME_MUST_START_WITH_LETTER = sys.version_info >= (3, 11)
+# On Python < 3.9, `urlsplit` treats "<name>:<digits>" (e.g. "localhost:5000") as a path with a
+# port number rather than a URI with a scheme, except for the "http" scheme
+_SCHEME_CANNOT_PRECEDE_PORT = sys.version_info < (3, 9)
+_KNOWN_SCHEMES = {
+    scheme: scheme
+    for scheme in (
+        *_DATABRICKS_SCHEMES,
+        *_DATABRICKS_PROFILE_ARTIFACT_SCHEMES,
+        *_HTTP_SCHEMES,
+        "file",
+        "s3",
+        *DATABASE_ENGINES,
+    )
+}
+
+
+def _remove_unsafe_url_chars(uri: str) -> str:
+    if "\t" in uri or "\r" in uri or "\n" in uri:
+        return uri.translate(_UNSAFE_URL_CHARS_TABLE)
+    return uri
+
+
+def _fast_scheme(uri: Optional[str]) -> str:
+    """
+    Returns the lowercased scheme of the specified URI, or an empty string if it has none.
+    Equivalent to ``urllib.parse.urlsplit(uri).scheme`` on the running Python version, including
+    its version-specific scheme rules, but avoids splitting the entire URI for callers that only
+    inspect the scheme. Returns an empty string for non-string input such
+    as ``None``, for which the scheme never matches any of the string schemes in this module.
+    """
+    if not isinstance(uri, str):
+        return ""
+    uri = _remove_unsafe_url_chars(uri.lstrip(_C0_CONTROL_OR_SPACE))
+    i = uri.find(":")
+    if i <= 0:
+        return ""
+    scheme = uri[:i]
+    if _SCHEME_CANNOT_PRECEDE_PORT and scheme != "http":
+        rest = uri[i + 1 :]
+        if rest.isascii() and rest.isdigit():
+            return ""
+    if _SCHEME_MUST_START_WITH_LETTER and scheme[0] not in string.ascii_letters:
+        return ""
+    if _SCHEME_CHARS.issuperset(scheme):
+        scheme = scheme.lower()
+        # Return the interned constant for well-known schemes so that comparisons against the
+        # scheme literals in this module short-circuit on identity. Arbitrary schemes are not
+        # interned, since interned strings may never be freed.
+        return _KNOWN_SCHEMES.get(scheme, scheme)
+    return ""
+
+
+def is_local_uri(uri: str, is_tracking_or_registry_uri: bool = True) -> bool:
     """
     Returns true if the specified URI is a local file path (/foo or file:/foo).
 
@@ -29,63 +119,134 @@ def is_local_uri(uri, is_tracking_or_registry_uri=True):
                             Model Registry URI. Examples of other URIs are MLflow artifact URIs,
                             filesystem paths, etc.
     """
+    parsed_uri = _urlsplit_cached(uri)
+    return _is_local_uri_components(
+        uri, parsed_uri.scheme, parsed_uri.netloc, is_tracking_or_registry_uri
+    )
+
+
+def parse_uri_batch(uris: Iterable[str]) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Parses the specified URIs in a single pass.
+
+    :param uris: An iterable of URIs.
+    :return: A tuple of three lists ``(schemes, netlocs, paths)``, where the i-th element of each
+             list is the corresponding component of the i-th URI.
+    """
+    schemes, netlocs, paths = [], [], []
+    for uri in uris:
+        # Batches may contain many distinct URIs, so they bypass `_urlsplit_cached` to avoid
+        # evicting the frequently used tracking and artifact root URIs from its cache
+        parsed_uri = urllib.parse.urlsplit(uri)
+        schemes.append(parsed_uri.scheme)
+        netlocs.append(parsed_uri.netloc)
+        paths.append(parsed_uri.path)
+    return schemes, netlocs, paths
+
+
+def is_local_uris(
+    uris: List[str],
+    schemes: List[str],
+    netlocs: List[str],
+    is_tracking_or_registry_uri: bool = True,
+) -> List[bool]:
+    """
+    Batch version of :py:func:`is_local_uri` that operates on the URI components returned by
+    :py:func:`parse_uri_batch`.
+
+    :param uris: The URIs.
+    :param schemes: The schemes of the URIs.
+    :param netlocs: The netlocs of the URIs.
+    :param is_tracking_or_registry_uri: Whether or not the URIs are MLflow Tracking or MLflow
+                                        Model Registry URIs.
+    :return: A list of booleans indicating whether each URI is a local file path.
+    """
+    return [
+        _is_local_uri_components(uri, scheme, netloc, is_tracking_or_registry_uri)
+        for uri, scheme, netloc in zip(uris, schemes, netlocs)
+    ]
+
+
+def _is_local_uri_components(
+    uri: str, scheme: str, netloc: str, is_tracking_or_registry_uri: bool
+) -> bool:
     if uri == "databricks" and is_tracking_or_registry_uri:
         return False
 
-    if is_windows() and uri.startswith("\\\\"):
+    if _IS_WINDOWS and uri.startswith("\\\\"):
         # windows network drive path looks like: "\\<server name>\path\..."
         return False
 
-    parsed_uri = urllib.parse.urlparse(uri)
-    if parsed_uri.hostname and not (
-        parsed_uri.hostname == "."
-        or parsed_uri.hostname.startswith("localhost")
-        or parsed_uri.hostname.startswith("127.0.0.1")
-    ):
+    hostname = _hostname_from_netloc(netloc)
+    if hostname and not (hostname == "." or hostname.startswith(_LOCAL_HOSTS)):
         return False
 
-    scheme = parsed_uri.scheme
-    if scheme == "" or scheme == "file":
+    if scheme in _LOCAL_SCHEMES:
         return True
 
-    if is_windows() and len(scheme) == 1 and scheme.lower() == pathlib.Path(uri).drive.lower()[0]:
-        return True
+    return _IS_WINDOWS and len(scheme) == 1 and scheme.lower() == pathlib.Path(uri).drive.lower()[0]
 
-    return False
+
+def _hostname_from_netloc(netloc: str) -> str:
+    # Same as `SplitResult.hostname`, except that an empty string is returned instead of None
+    if not netloc:
+        return ""
+    hostinfo = netloc.rpartition("@")[2]
+    _, has_open_bracket, bracketed = hostinfo.partition("[")
+    if has_open_bracket:
+        hostname = bracketed.partition("]")[0]
+    else:
+        hostname = hostinfo.partition(":")[0]
+    return hostname.lower()
 
 
-def is_file_uri(uri):
-    return urllib.parse.urlparse(uri).scheme == "file"
+def is_file_uri(uri: Optional[str]) -> bool:
+    return _fast_scheme(uri) == "file"
 
 
-def is_http_uri(uri):
-    scheme = urllib.parse.urlparse(uri).scheme
-    return scheme == "http" or scheme == "https"
+def is_http_uri(uri: Optional[str]) -> bool:
+    return _fast_scheme(uri) in _HTTP_SCHEMES
 
 
-def is_databricks_uri(uri):
+def is_databricks_uri(uri: Optional[str]) -> bool:
     """
     Databricks URIs look like 'databricks' (default profile) or 'databricks://profile'
     or 'databricks://secret_scope:secret_key_prefix'.
     """
-    scheme = urllib.parse.urlparse(uri).scheme
-    return scheme == "databricks" or uri == "databricks"
+    return uri == "databricks" or _fast_scheme(uri) == "databricks"
 
 
-def is_databricks_unity_catalog_uri(uri):
-    scheme = urllib.parse.urlparse(uri).scheme
-    return scheme == _DATABRICKS_UNITY_CATALOG_SCHEME or uri == _DATABRICKS_UNITY_CATALOG_SCHEME
+def is_databricks_unity_catalog_uri(uri: Optional[str]) -> bool:
+    return (
+        uri == _DATABRICKS_UNITY_CATALOG_SCHEME
+        or _fast_scheme(uri) == _DATABRICKS_UNITY_CATALOG_SCHEME
+    )
 
 
-def construct_db_uri_from_profile(profile):
+def construct_db_uri_from_profile(profile: Optional[str]) -> Optional[str]:
     if profile:
         return "databricks://" + profile
+    return None
+
+
+def _is_valid_db_scope_prefix_info(scope: str, prefix: Optional[str]) -> bool:
+    """
+    Non-raising version of `validate_db_scope_prefix_info`.
+    """
+    if not _BAD_DB_SCOPE_CHARS.isdisjoint(scope):
+        return False
+    if prefix is None:
+        return True
+    return _BAD_DB_SCOPE_CHARS.isdisjoint(prefix) and prefix.strip() != ""
 
 
 # Both scope and key_prefix should not contain special chars for URIs, like '/'
-# and ':'.
-def validate_db_scope_prefix_info(scope, prefix):
-    for c in ["/", ":", " "]:
+# and ':'. Only successful validations are cached; invalid inputs raise on every call.
+@lru_cache(maxsize=128)
+def validate_db_scope_prefix_info(scope: str, prefix: Optional[str]) -> None:
+    if _is_valid_db_scope_prefix_info(scope, prefix):
+        return
+    for c in _BAD_DB_SCOPE_CHARS_ORDERED:
         if c in scope:
             raise MlflowException(
                 "Unsupported Databricks profile name: %s." % scope
@@ -103,99 +264,114 @@ def validate_db_scope_prefix_info(scope, prefix):
         )
 
 
-def get_db_info_from_uri(uri):
+def get_db_info_from_uri(uri: str) -> Tuple[Optional[str], Optional[str]]:
     """
     Get the Databricks profile specified by the tracking URI (if any), otherwise
     returns None.
     """
-    parsed_uri = urllib.parse.urlparse(uri)
-    if parsed_uri.scheme == "databricks" or parsed_uri.scheme == _DATABRICKS_UNITY_CATALOG_SCHEME:
+    parsed_uri = _urlsplit_cached(uri)
+    if parsed_uri.scheme in _DATABRICKS_SCHEMES:
         # netloc should not be an empty string unless URI is formatted incorrectly.
         if parsed_uri.netloc == "":
             raise MlflowException(
                 "URI is formatted incorrectly: no netloc in URI '%s'." % uri
                 + " This may be the case if there is only one slash in the URI."
             )
-        profile_tokens = parsed_uri.netloc.split(":")
-        parsed_scope = profile_tokens[0]
-        if len(profile_tokens) == 1:
-            parsed_key_prefix = None
-        elif len(profile_tokens) == 2:
-            parsed_key_prefix = profile_tokens[1]
-        else:
-            # parse the content before the first colon as the profile.
-            parsed_key_prefix = ":".join(profile_tokens[1:])
+        # parse the content before the first colon as the profile.
+        parsed_scope, sep, key_prefix = parsed_uri.netloc.partition(":")
+        parsed_key_prefix = key_prefix if sep else None
         validate_db_scope_prefix_info(parsed_scope, parsed_key_prefix)
         return parsed_scope, parsed_key_prefix
     return None, None
 
 
-def get_databricks_profile_uri_from_artifact_uri(uri, result_scheme="databricks"):
+def get_databricks_profile_uri_from_artifact_uri(
+    uri: str, result_scheme: str = "databricks"
+) -> Optional[str]:
     """
     Retrieves the netloc portion of the URI as a ``databricks://`` or `databricks-uc://` URI,
     if it is a proper Databricks profile specification, e.g.
     ``profile@databricks`` or ``secret_scope:key_prefix@databricks``.
     """
-    parsed = urllib.parse.urlparse(uri)
+    return _get_databricks_profile_uri_from_artifact_uri(uri, result_scheme, raise_on_invalid=True)
+
+
+def _get_databricks_profile_uri_from_artifact_uri(
+    uri: str, result_scheme: str, raise_on_invalid: bool
+) -> Optional[str]:
+    """
+    Implementation of `get_databricks_profile_uri_from_artifact_uri`. If `raise_on_invalid` is
+    False, returns None for an invalid profile specification instead of raising.
+    """
+    parsed = _urlsplit_cached(uri)
     if not parsed.netloc or parsed.hostname != result_scheme:
         return None
     if not parsed.username:  # no profile or scope:key
         return result_scheme  # the default tracking/registry URI
-    validate_db_scope_prefix_info(parsed.username, parsed.password)
+    if raise_on_invalid:
+        validate_db_scope_prefix_info(parsed.username, parsed.password)
+    elif not _is_valid_db_scope_prefix_info(parsed.username, parsed.password):
+        return None
     key_prefix = ":" + parsed.password if parsed.password else ""
     return f"{result_scheme}://" + parsed.username + key_prefix
 
 
-def remove_databricks_profile_info_from_artifact_uri(artifact_uri):
+def remove_databricks_profile_info_from_artifact_uri(
+    artifact_uri: Optional[str],
+) -> Optional[str]:
     """
     Only removes the netloc portion of the URI if it is a Databricks
     profile specification, e.g.
     ``profile@databricks`` or ``secret_scope:key_prefix@databricks``.
     """
-    parsed = urllib.parse.urlparse(artifact_uri)
+    # Hostnames are compared case-insensitively, so the lowercased URI must mention "databricks"
+    # once the characters that `urlsplit` discards are removed
+    if not artifact_uri or "databricks" not in _remove_unsafe_url_chars(artifact_uri).lower():
+        return artifact_uri
+    parsed = _urlsplit_cached(artifact_uri)
     if not parsed.netloc or parsed.hostname != "databricks":
         return artifact_uri
-    return urllib.parse.urlunparse(parsed._replace(netloc=""))
+    return urllib.parse.urlunsplit(parsed._replace(netloc=""))
 
 
-def add_databricks_profile_info_to_artifact_uri(artifact_uri, databricks_profile_uri):
+def add_databricks_profile_info_to_artifact_uri(
+    artifact_uri: Optional[str], databricks_profile_uri: Optional[str]
+) -> Optional[str]:
     """
     Throws an exception if ``databricks_profile_uri`` is not valid.
     """
     if not databricks_profile_uri or not is_databricks_uri(databricks_profile_uri):
         return artifact_uri
-    artifact_uri_parsed = urllib.parse.urlparse(artifact_uri)
+    # Only these schemes accept profile info, so other URIs are returned without parsing them
+    if not artifact_uri or _fast_scheme(artifact_uri) not in _DATABRICKS_PROFILE_ARTIFACT_SCHEMES:
+        return artifact_uri
+    artifact_uri_parsed = _urlsplit_cached(artifact_uri)
     # Do not overwrite the authority section if there is already one
     if artifact_uri_parsed.netloc:
         return artifact_uri
 
-    scheme = artifact_uri_parsed.scheme
-    if scheme == "dbfs" or scheme == "runs" or scheme == "models":
-        if databricks_profile_uri == "databricks":
-            netloc = "databricks"
-        else:
-            (profile, key_prefix) = get_db_info_from_uri(databricks_profile_uri)
-            prefix = ":" + key_prefix if key_prefix else ""
-            netloc = profile + prefix + "@databricks"
-        new_parsed = artifact_uri_parsed._replace(netloc=netloc)
-        return urllib.parse.urlunparse(new_parsed)
+    if databricks_profile_uri == "databricks":
+        netloc = "databricks"
     else:
-        return artifact_uri
+        (profile, key_prefix) = get_db_info_from_uri(databricks_profile_uri)
+        # `databricks_profile_uri` has a Databricks scheme here, so a profile is always parsed
+        assert profile is not None
+        prefix = ":" + key_prefix if key_prefix else ""
+        netloc = profile + prefix + "@databricks"
+    new_parsed = artifact_uri_parsed._replace(netloc=netloc)
+    return urllib.parse.urlunsplit(new_parsed)
 
 
-def extract_db_type_from_uri(db_uri):
+@lru_cache(maxsize=32)
+def extract_db_type_from_uri(db_uri: str) -> str:
     """
     Parse the specified DB URI to extract the database type. Confirm the database type is
     supported. If a driver is specified, confirm it passes a plausible regex.
     """
-    scheme = urllib.parse.urlparse(db_uri).scheme
-    scheme_plus_count = scheme.count("+")
-
-    if scheme_plus_count == 0:
-        db_type = scheme
-    elif scheme_plus_count == 1:
-        db_type, _ = scheme.split("+")
-    else:
+    # `_fast_scheme` follows the same scheme rules as `urlsplit` on every supported Python
+    # version, so the scheme is split into `<db_type>[+<driver>]` with a single partition
+    db_type, _, driver = _fast_scheme(db_uri).partition("+")
+    if "+" in driver:
         error_msg = f"Invalid database URI: '{db_uri}'. {_INVALID_DB_URI_MSG}"
         raise MlflowException(error_msg, INVALID_PARAMETER_VALUE)
 
@@ -204,20 +380,34 @@ def extract_db_type_from_uri(db_uri):
     return db_type
 
 
-def get_uri_scheme(uri_or_path):
-    scheme = urllib.parse.urlparse(uri_or_path).scheme
-    if any(scheme.lower().startswith(db) for db in DATABASE_ENGINES):
+@lru_cache(maxsize=256)
+def get_uri_scheme(uri_or_path: str) -> str:
+    scheme = _fast_scheme(uri_or_path)
+    if scheme.startswith(_DB_ENGINE_PREFIXES):
         return extract_db_type_from_uri(uri_or_path)
     return scheme
 
 
-def extract_and_normalize_path(uri):
-    parsed_uri_path = urllib.parse.urlparse(uri).path
-    normalized_path = posixpath.normpath(parsed_uri_path)
-    return normalized_path.lstrip("/")
+@lru_cache(maxsize=256)
+def extract_and_normalize_path(uri: str) -> str:
+    parsed_uri_path = _urlsplit_cached(uri).path
+    return _normalize_path_and_strip_leading_slashes(parsed_uri_path)
+
+
+def _normalize_path_and_strip_leading_slashes(path: str) -> str:
+    """
+    Equivalent to ``posixpath.normpath(path).lstrip("/")``. Paths without '.' or '..'
+    segments, which is almost always the case for artifact URIs, only need redundant
+    separators collapsed, so the full normalization is skipped for them.
+    """
+    if not path or "/." in path or path.startswith("."):
+        return posixpath.normpath(path).lstrip("/")
+    while "//" in path:
+        path = path.replace("//", "/")
+    return path.strip("/")
 
 
-def append_to_uri_path(uri, *paths):
+def append_to_uri_path(uri: str, *paths: str) -> str:
     """
     Appends the specified POSIX `paths` to the path component of the specified `uri`.
 
@@ -233,11 +423,9 @@ def append_to_uri_path(uri, *paths):
     >>> uri2 = append_to_uri_path(uri2, "/some", "subpath")
     >>> assert uri2 == "a/posixpath/some/subpath"
     """
-    path = ""
-    for subpath in paths:
-        path = _join_posixpaths_and_append_absolute_suffixes(path, subpath)
+    path = _join_posixpath_suffixes(paths)
 
-    parsed_uri = urllib.parse.urlparse(uri)
+    parsed_uri = _urlsplit_cached(uri)
     if len(parsed_uri.scheme) == 0:
         # If the input URI does not define a scheme, we assume that it is a POSIX path
         # and join it with the specified input paths
@@ -245,19 +433,19 @@ def append_to_uri_path(uri, *paths):
 
     prefix = ""
     if not parsed_uri.path.startswith("/"):
-        # For certain URI schemes (e.g., "file:"), urllib's unparse routine does
+        # For certain URI schemes (e.g., "file:"), urllib's unsplit routine does
         # not preserve the relative URI path component properly. In certain cases,
-        # urlunparse converts relative paths to absolute paths. We introduce this logic
-        # to circumvent urlunparse's erroneous conversion
+        # urlunsplit converts relative paths to absolute paths. We introduce this logic
+        # to circumvent urlunsplit's erroneous conversion
         prefix = parsed_uri.scheme + ":"
         parsed_uri = parsed_uri._replace(scheme="")
 
     new_uri_path = _join_posixpaths_and_append_absolute_suffixes(parsed_uri.path, path)
     new_parsed_uri = parsed_uri._replace(path=new_uri_path)
-    return prefix + urllib.parse.urlunparse(new_parsed_uri)
+    return prefix + urllib.parse.urlunsplit(new_parsed_uri)
 
 
-def append_to_uri_query_params(uri, *query_params: Tuple[str, Any]) -> str:
+def append_to_uri_query_params(uri: str, *query_params: Tuple[str, Any]) -> str:
     """
     Appends the specified query parameters to an existing URI.
 
@@ -265,15 +453,36 @@ def append_to_uri_query_params(uri, *query_params: Tuple[str, Any]) -> str:
     :param query_params: Query parameters to append. Each parameter should
                          be a 2-element tuple. For example, ``("key", "value")``.
     """
-    parsed_uri = urllib.parse.urlparse(uri)
-    parsed_query = urllib.parse.parse_qsl(parsed_uri.query)
-    new_parsed_query = parsed_query + list(query_params)
-    new_query = urllib.parse.urlencode(new_parsed_query)
+    parsed_uri = _urlsplit_cached(uri)
+    # The existing query string is already encoded, so it is kept verbatim rather than being
+    # parsed and re-encoded along with the new parameters
+    new_query = urllib.parse.urlencode(list(query_params))
+    if parsed_uri.query and new_query:
+        new_query = f"{parsed_uri.query}&{new_query}"
+    elif parsed_uri.query:
+        new_query = parsed_uri.query
     new_parsed_uri = parsed_uri._replace(query=new_query)
-    return urllib.parse.urlunparse(new_parsed_uri)
+    return urllib.parse.urlunsplit(new_parsed_uri)
 
 
-def _join_posixpaths_and_append_absolute_suffixes(prefix_path, suffix_path):
+def _join_posixpath_suffixes(paths: Tuple[str, ...]) -> str:
+    """
+    Joins the specified POSIX `paths` in a single ``posixpath.join()`` call. Equivalent to
+    folding `paths` with `_join_posixpaths_and_append_absolute_suffixes`, starting from an
+    empty path.
+
+    >>> assert _join_posixpath_suffixes(("/some", "subpath", "/another")) == "/some/subpath/another"
+    >>> assert _join_posixpath_suffixes(("", "relpath", "")) == "relpath/"
+    """
+    for i, first_path in enumerate(paths):
+        if first_path:
+            # Leading empty paths are skipped; the first non-empty path is kept as-is and every
+            # following path is relativized so that posixpath.join() does not discard the prefix
+            return posixpath.join(first_path, *(p.lstrip(posixpath.sep) for p in paths[i + 1 :]))
+    return ""
+
+
+def _join_posixpaths_and_append_absolute_suffixes(prefix_path: str, suffix_path: str) -> str:
     """
     Joins the POSIX path `prefix_path` with the POSIX path `suffix_path`. Unlike posixpath.join(),
     if `suffix_path` is an absolute path, it is appended to prefix_path.
@@ -297,30 +506,38 @@ def _join_posixpaths_and_append_absolute_suffixes(prefix_path, suffix_path):
     return posixpath.join(prefix_path, suffix_path)
 
 
-def is_databricks_acled_artifacts_uri(artifact_uri):
+def is_databricks_acled_artifacts_uri(artifact_uri: str) -> bool:
     _ACLED_ARTIFACT_URI = "databricks/mlflow-tracking/"
+    # Normalization only collapses separators and dot segments, so the "mlflow-tracking"
+    # segment must appear verbatim in any matching URI once the characters that `urlsplit`
+    # discards are removed. Skip parsing when it doesn't.
+    if "mlflow-tracking" not in _remove_unsafe_url_chars(artifact_uri):
+        return False
     artifact_uri_path = extract_and_normalize_path(artifact_uri)
     return artifact_uri_path.startswith(_ACLED_ARTIFACT_URI)
 
 
-def is_databricks_model_registry_artifacts_uri(artifact_uri):
+def is_databricks_model_registry_artifacts_uri(artifact_uri: str) -> bool:
     _MODEL_REGISTRY_ARTIFACT_URI = "databricks/mlflow-registry/"
+    if "mlflow-registry" not in _remove_unsafe_url_chars(artifact_uri):
+        return False
     artifact_uri_path = extract_and_normalize_path(artifact_uri)
     return artifact_uri_path.startswith(_MODEL_REGISTRY_ARTIFACT_URI)
 
 
-def is_valid_dbfs_uri(uri):
-    parsed = urllib.parse.urlparse(uri)
-    if parsed.scheme != "dbfs":
+def is_valid_dbfs_uri(uri: str) -> bool:
+    # Most artifact URIs are not DBFS URIs, so check the scheme before splitting the URI
+    if _fast_scheme(uri) != "dbfs":
         return False
-    try:
-        db_profile_uri = get_databricks_profile_uri_from_artifact_uri(uri)
-    except MlflowException:
-        db_profile_uri = None
-    return not parsed.netloc or db_profile_uri is not None
+    if not _urlsplit_cached(uri).netloc:
+        return True
+    db_profile_uri = _get_databricks_profile_uri_from_artifact_uri(
+        uri, "databricks", raise_on_invalid=False
+    )
+    return db_profile_uri is not None
 
 
-def dbfs_hdfs_uri_to_fuse_path(dbfs_uri):
+def dbfs_hdfs_uri_to_fuse_path(dbfs_uri: str) -> str:
     """
     Converts the provided DBFS URI into a DBFS FUSE path
     :param dbfs_uri: A DBFS URI like "dbfs:/my-directory". Can also be a scheme-less URI like
@@ -340,7 +557,7 @@ def dbfs_hdfs_uri_to_fuse_path(dbfs_uri):
     return _DBFS_FUSE_PREFIX + dbfs_uri[len(_DBFS_HDFS_URI_PREFIX) :]
 
 
-def resolve_uri_if_local(local_uri):
+def resolve_uri_if_local(local_uri: Optional[str]) -> Optional[str]:
     """
     if `local_uri` is passed in as a relative local path, this function
     resolves it to absolute path relative to current working directory.
@@ -357,7 +574,7 @@ def resolve_uri_if_local(local_uri):
         local_path = local_file_uri_to_path(local_uri)
         if not pathlib.Path(local_path).is_absolute():
             if scheme == "":
-                if is_windows():
+                if _IS_WINDOWS:
                     return urllib.parse.urlunsplit(
                         (
                             "file",
@@ -368,7 +585,7 @@ def resolve_uri_if_local(local_uri):
                         )
                     )
                 return cwd.joinpath(local_path).as_posix()
-            local_uri_split = urllib.parse.urlsplit(local_uri)
+            local_uri_split = _urlsplit_cached(local_uri)
             resolved_absolute_uri = urllib.parse.urlunsplit(
                 (
                     local_uri_split.scheme,
@@ -382,5 +599,5 @@ def resolve_uri_if_local(local_uri):
     return local_uri
 
 
-def generate_tmp_dfs_path(dfs_tmp):
-    return posixpath.join(dfs_tmp, str(uuid.uuid4()))
+def generate_tmp_dfs_path(dfs_tmp: Union[str, "os.PathLike[str]"]) -> str:
+    return posixpath.join(dfs_tmp, uuid.uuid4().hex)